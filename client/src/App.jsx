@@ -72,10 +72,14 @@ function App() {
 
     // Create new WebSocket connection
     const ws = new WebSocket(`${config.WS_URL}/chat/${userId}?room=${room}`);
+    // Server sends JSON as binary frames
+    ws.binaryType = 'arraybuffer';
+    const decoder = new TextDecoder();
 
     ws.onmessage = (event) => {
-      console.log("Received message:", event.data);
-      setMessages(prev => [...prev, JSON.parse(event.data)]);
+      const data = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+      console.log("Received message:", data);
+      setMessages(prev => [...prev, JSON.parse(data)]);
     };
 
     ws.onclose = () => {